@@ -11,9 +11,129 @@ License: CC BY-NC 4.0
 
 import math
 import argparse
+import io
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from xml.etree import ElementTree as ET
 
+# Optional export dependencies, loaded once for all conversions
+# (cairocffi raises OSError when the cairo library itself is missing)
+try:
+    import cairosvg
+    _HAS_CAIROSVG = True
+except (ImportError, OSError):
+    _HAS_CAIROSVG = False
+
+try:
+    import cairo
+    _HAS_PYCAIRO = True
+except ImportError:
+    _HAS_PYCAIRO = False
+
+try:
+    from PIL import Image
+    _HAS_PIL = True
+except ImportError:
+    _HAS_PIL = False
+
+def _format_coordinate(value):
+    """Format a coordinate to 0.01 mm, without trailing zeros (145.00 → 145)."""
+    text = f"{value:.2f}".rstrip('0').rstrip('.')
+    return "0" if text == "-0" else text
+
+# Basic CSS color names accepted by render_pdf
+_NAMED_COLORS = {
+    "black": "#000000", "silver": "#c0c0c0", "gray": "#808080", "grey": "#808080",
+    "white": "#ffffff", "maroon": "#800000", "red": "#ff0000", "purple": "#800080",
+    "fuchsia": "#ff00ff", "magenta": "#ff00ff", "green": "#008000", "lime": "#00ff00",
+    "olive": "#808000", "yellow": "#ffff00", "navy": "#000080", "blue": "#0000ff",
+    "teal": "#008080", "aqua": "#00ffff", "cyan": "#00ffff", "orange": "#ffa500"
+}
+
+def _interpolate(dim_small, dim_large, ratio):
+    """Linear interpolation between two dimensions."""
+    return dim_small + (dim_large - dim_small) * ratio
+
+def _trapezoid_points(fold_index, x_center, width_base, margin, fold_cycle, stiffener_height, chamfer):
+    """
+    Build the trapezoid of a fold from its already interpolated base width.
+
+    Args:
+        fold_index: Current fold index
+        x_center: Horizontal center position
+        width_base: Base width of the fold's pair
+        margin, fold_cycle, stiffener_height, chamfer: Generator dimensions in mm
+
+    Returns:
+        List of 4 points [(x,y), ...] defining the trapezoid
+    """
+    # Apply Geometry Constraint LOCALLY for the shape (preserves fold geometry)
+    # The other side of the trapezoid is strictly Base + 2*H
+    width_expanded = width_base + (2.0 * stiffener_height)
+
+    if fold_index % 2 == 0:
+        # Even folds (0,2...): Narrow Top (Base) -> Wide Bottom (Expanded) (▽)
+        width_top = width_base
+        width_bottom = width_expanded
+    else:
+        # Odd folds (1,3...): Wide Top (Expanded) -> Narrow Bottom (Base) (△)
+        width_top = width_expanded
+        width_bottom = width_base
+
+    # Calculate vertical positions
+    y_top = margin + fold_index * fold_cycle
+    y_bottom = y_top + stiffener_height
+
+    # Half-widths
+    hw_top = width_top / 2.0
+    hw_bottom = width_bottom / 2.0
+
+    # Create trapezoid points with chamfer
+    points = [
+        (x_center - hw_top + chamfer, y_top),
+        (x_center + hw_top - chamfer, y_top),
+        (x_center + hw_bottom - chamfer, y_bottom),
+        (x_center - hw_bottom + chamfer, y_bottom)
+    ]
+    return points
+
+def _rectangle_points(fold_index, x_center, width, margin, fold_cycle, stiffener_height, chamfer):
+    """
+    Build the rectangle of a fold from its already interpolated width.
+
+    Args:
+        fold_index: Current fold index
+        x_center: Horizontal center position
+        width: Width of the fold
+        margin, fold_cycle, stiffener_height, chamfer: Generator dimensions in mm
+
+    Returns:
+        List of 4 points [(x,y), ...] defining the rectangle
+    """
+    y_top = margin + fold_index * fold_cycle
+    y_bottom = y_top + stiffener_height
+    hw = width / 2.0
+
+    points = [
+        (x_center - hw + chamfer, y_top),
+        (x_center + hw - chamfer, y_top),
+        (x_center + hw - chamfer, y_bottom),
+        (x_center - hw + chamfer, y_bottom)
+    ]
+    return points
+
+# Header written by _create_svg_header, used to recognize our own files
+_GENERATED_HEADER = re.compile(
+    r'<\?xml version="1\.0" encoding="UTF-8"\?>\n'
+    r'<svg xmlns="http://www\.w3\.org/2000/svg" \n'
+    r'     width="([\d.]+)mm" \n'
+    r'     height="([\d.]+)mm" \n'
+    r'     viewBox="0 0 [\d.]+ [\d.]+">\n')
+
+# Every fold is a 4-point polygon, emitted by filling this single template
+_POLYGON_TEMPLATE = '    <polygon points="%s,%s %s,%s %s,%s %s,%s"/>\n'
+
 class ConicBellowsGenerator:
     """
     Generator for conical camera bellows patterns.
@@ -70,6 +190,34 @@ class ConicBellowsGenerator:
 
         self.total_length = self.num_folds * self.fold_cycle
 
+        # Layout of the SVG files written by this generator, by filename:
+        # (view_x, view_y, width, height, [(bbox, group_svg, face_points), ...])
+        self._layouts = {}
+
+        # Fold shapes and their bounding boxes, computed on first use
+        # and shared by every output (see _get_fold_shapes)
+        self._fold_shapes = None
+
+        # Progression ratios, shared by every face (see _get_ratios)
+        self._ratios = None
+
+    def _get_ratios(self):
+        """
+        Get the pair and continuous progression ratios.
+
+        They only depend on the fold count, so they are computed once and
+        recomputed if num_folds changes.
+
+        Returns:
+            Tuple (pair_ratios, continuous_ratios)
+        """
+        if self._ratios is None or self._ratios[0] != self.num_folds:
+            num_pairs = self.num_folds // 2
+            self._ratios = (self.num_folds,
+                            [p / max(num_pairs - 1, 1) for p in range(num_pairs)],
+                            [i / max(self.num_folds - 1, 1) for i in range(self.num_folds)])
+        return self._ratios[1], self._ratios[2]
+
     def get_pair_dimension(self, fold_index, dim_small, dim_large):
         """
         Calculate dimension for a PAIR of folds.
@@ -83,10 +231,12 @@ class ConicBellowsGenerator:
         Returns:
             Interpolated dimension for this fold's pair
         """
-        pair_index = fold_index // 2
-        num_pairs = self.num_folds // 2
-        ratio = pair_index / max(num_pairs - 1, 1)
-        return dim_small + (dim_large - dim_small) * ratio
+        if 0 <= fold_index < self.num_folds:
+            ratio = self._get_ratios()[0][fold_index // 2]
+        else:
+            # Outside the bellows: extrapolate along the same progression
+            ratio = (fold_index // 2) / max(self.num_folds // 2 - 1, 1)
+        return _interpolate(dim_small, dim_large, ratio)
 
     def get_continuous_dimension(self, fold_index, dim_small, dim_large):
         """
@@ -101,8 +251,12 @@ class ConicBellowsGenerator:
         Returns:
             Interpolated dimension for this fold
         """
-        ratio = fold_index / max(self.num_folds - 1, 1)
-        return dim_small + (dim_large - dim_small) * ratio
+        if 0 <= fold_index < self.num_folds:
+            ratio = self._get_ratios()[1][fold_index]
+        else:
+            # Outside the bellows: extrapolate along the same progression
+            ratio = fold_index / max(self.num_folds - 1, 1)
+        return _interpolate(dim_small, dim_large, ratio)
 
     def create_trapezoid(self, fold_index, x_center):
         """
@@ -120,41 +274,11 @@ class ConicBellowsGenerator:
             List of 4 points [(x,y), ...] defining the trapezoid
         """
 
-        # 1. Calculate Base Width using interpolation (preserves Front/Rear dimensions)
-        pair_index = fold_index // 2
-        num_pairs = self.num_folds // 2
-        ratio = pair_index / max(num_pairs - 1, 1)
-        width_base = self.front_w + (self.rear_w - self.front_w) * ratio
-
-        # 2. Apply Geometry Constraint LOCALLY for the shape (preserves fold geometry)
-        # The other side of the trapezoid is strictly Base + 2*H
-        width_expanded = width_base + (2.0 * self.stiffener_height)
+        # Calculate Base Width using interpolation (preserves Front/Rear dimensions)
+        width_base = self.get_pair_dimension(fold_index, self.front_w, self.rear_w)
+        return _trapezoid_points(fold_index, x_center, width_base, self.margin,
+                                 self.fold_cycle, self.stiffener_height, self.chamfer)
 
-        if fold_index % 2 == 0:
-            # Even folds (0,2...): Narrow Top (Base) -> Wide Bottom (Expanded) (▽)
-            width_top = width_base
-            width_bottom = width_expanded
-        else:
-            # Odd folds (1,3...): Wide Top (Expanded) -> Narrow Bottom (Base) (△)
-            width_top = width_expanded
-            width_bottom = width_base
-
-        # Calculate vertical positions
-        y_top = self.margin + fold_index * self.fold_cycle
-        y_bottom = y_top + self.stiffener_height
-
-        # Half-widths
-        hw_top = width_top / 2.0
-        hw_bottom = width_bottom / 2.0
-
-        # Create trapezoid points with chamfer
-        points = [
-            (x_center - hw_top + self.chamfer, y_top),
-            (x_center + hw_top - self.chamfer, y_top),
-            (x_center + hw_bottom - self.chamfer, y_bottom),
-            (x_center - hw_bottom + self.chamfer, y_bottom)
-        ]
-        return points
     def create_rectangle(self, fold_index, x_center):
         """
         Create a RECTANGLE with continuous progression.
@@ -167,26 +291,98 @@ class ConicBellowsGenerator:
             List of 4 points [(x,y), ...] defining the rectangle
         """
         width = self.get_continuous_dimension(fold_index, self.front_h, self.rear_h)
+        return _rectangle_points(fold_index, x_center, width, self.margin,
+                                 self.fold_cycle, self.stiffener_height, self.chamfer)
 
-        y_top = self.margin + fold_index * self.fold_cycle
-        y_bottom = y_top + self.stiffener_height
-        hw = width / 2.0
+    def _compute_fold_shapes(self):
+        """
+        Compute the trapezoid and rectangle of every fold, centered on x = 0.
+
+        Single pass over the folds: the progression ratios and dimensions
+        are read once, and the shapes are built by the same module-level
+        _trapezoid_points and _rectangle_points as create_trapezoid and
+        create_rectangle.
+
+        Returns:
+            Dict {"trapezoid": [...], "rectangle": [...]} holding
+            4 points [(x,y), ...] per fold
+        """
+        # Bind everything used in the loop to locals once
+        pair_ratios, cont_ratios = self._get_ratios()
+        front_w, rear_w, front_h, rear_h = self.front_w, self.rear_w, self.front_h, self.rear_h
+        dims = (self.margin, self.fold_cycle, self.stiffener_height, self.chamfer)
+        num_folds = self.num_folds
+        trapezoids = [None] * num_folds
+        rectangles = [None] * num_folds
+
+        for i in range(num_folds):
+            width_base = _interpolate(front_w, rear_w, pair_ratios[i // 2])
+            trapezoids[i] = _trapezoid_points(i, 0.0, width_base, *dims)
+            width = _interpolate(front_h, rear_h, cont_ratios[i])
+            rectangles[i] = _rectangle_points(i, 0.0, width, *dims)
+
+        return {"trapezoid": trapezoids, "rectangle": rectangles}
+
+    def _get_fold_shapes(self):
+        """
+        Get the fold shapes centered on x = 0, with their bounding boxes.
+
+        The geometry is computed once by _compute_fold_shapes and reused
+        for every face and output (combined pattern, separate faces, pages
+        and PDF rendering). It is recomputed whenever one of the dimensions
+        it depends on has been changed.
 
-        points = [
-            (x_center - hw + self.chamfer, y_top),
-            (x_center + hw - self.chamfer, y_top),
-            (x_center + hw - self.chamfer, y_bottom),
-            (x_center - hw + self.chamfer, y_bottom)
-        ]
-        return points
+        Returns:
+            Dict {shape_type: (folds, (x0, y0, x1, y1))}, the bounding box
+            being None when there are no folds
+        """
+        key = (self.front_w, self.front_h, self.rear_w, self.rear_h,
+               self.stiffener_height, self.chamfer, self.margin,
+               self.fold_cycle, self.num_folds)
+        if self._fold_shapes is None or self._fold_shapes[0] != key:
+            shapes = {}
+            for shape_type, folds in self._compute_fold_shapes().items():
+                xs = [x for points in folds for x, _ in points]
+                ys = [y for points in folds for _, y in points]
+                bbox = (min(xs), min(ys), max(xs), max(ys)) if folds else None
+                shapes[shape_type] = (folds, bbox)
+            self._fold_shapes = (key, shapes)
+        return self._fold_shapes[1]
+
+    def _compute_all_points(self, faces):
+        """
+        Compute the points of every fold for several faces.
+
+        The cached shapes from _get_fold_shapes are translated to the
+        center of every face using them.
+
+        Args:
+            faces: List of (shape_type, x_center) tuples, shape_type being
+                   "trapezoid" or "rectangle"
+
+        Returns:
+            One (face_points, bbox) tuple per face, face_points holding
+            4 points [(x,y), ...] per fold
+        """
+        shapes = self._get_fold_shapes()
+        all_points = []
+        for shape_type, x_center in faces:
+            folds, bbox = shapes[shape_type]
+            face_points = [[(x_center + x, y) for x, y in points] for points in folds]
+            if bbox is not None:
+                bbox = (x_center + bbox[0], bbox[1], x_center + bbox[2], bbox[3])
+            all_points.append((face_points, bbox))
+        return all_points
 
     def points_to_path(self, points):
-        """Convert points to SVG path string."""
-        path = f"M {points[0][0]:.2f},{points[0][1]:.2f} "
-        for p in points[1:]:
-            path += f"L {p[0]:.2f},{p[1]:.2f} "
-        path += "Z"
-        return path
+        """
+        Convert points to SVG path string.
+
+        Kept for external callers: the pattern itself is written as
+        <polygon> elements (see _create_face_group).
+        """
+        template = "M %.2f,%.2f " + "L %.2f,%.2f " * (len(points) - 1) + "Z"
+        return template % tuple(v for p in points for v in p)
 
     def generate_svg(self, filename="bellows_pattern.svg", separate_faces=False):
         """
@@ -219,30 +415,25 @@ class ConicBellowsGenerator:
 
         # Create SVG
         svg = self._create_svg_header(canvas_width, canvas_height)
-        svg.append(f'  <g id="stiffeners" stroke="{self.stroke_color}" stroke-width="{self.stroke_width}" fill="none">\n')
-
-        for i in range(self.num_folds):
-            # Face 1: TOP (trapezoid)
-            points1 = self.create_trapezoid(i, x_face1_center)
-            svg.append(f'    <path d="{self.points_to_path(points1)}"/>\n')
-
-            # Face 2: RIGHT (rectangle)
-            points2 = self.create_rectangle(i, x_face2_center)
-            svg.append(f'    <path d="{self.points_to_path(points2)}"/>\n')
 
-            # Face 3: BOTTOM (trapezoid)
-            points3 = self.create_trapezoid(i, x_face3_center)
-            svg.append(f'    <path d="{self.points_to_path(points3)}"/>\n')
-
-            # Face 4: LEFT (rectangle)
-            points4 = self.create_rectangle(i, x_face4_center)
-            svg.append(f'    <path d="{self.points_to_path(points4)}"/>\n')
-
-        svg.append('  </g>\n')
+        # Faces: TOP (trapezoid), RIGHT (rectangle), BOTTOM (trapezoid), LEFT (rectangle)
+        faces = self._compute_all_points([
+            ("trapezoid", x_face1_center),
+            ("rectangle", x_face2_center),
+            ("trapezoid", x_face3_center),
+            ("rectangle", x_face4_center)
+        ])
+
+        # One group per face, so that page splitting can skip whole faces
+        face_ids = ["face1_top", "face2_right", "face3_bottom", "face4_left"]
+        groups = [self._create_face_group(face_id, face_points, bbox)
+                  for face_id, (face_points, bbox) in zip(face_ids, faces)]
+        self._layouts[filename] = (0, 0, canvas_width, canvas_height, groups)
+
+        svg.extend(group[1] for group in groups)
         svg.append('</svg>')
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.writelines(svg)
+        self._write_svg(filename, svg)
 
         return [filename]
 
@@ -277,20 +468,14 @@ class ConicBellowsGenerator:
         x_center = self.margin + max_width / 2
 
         svg = self._create_svg_header(canvas_width, canvas_height)
-        svg.append(f'  <g id="face" stroke="{self.stroke_color}" stroke-width="{self.stroke_width}" fill="none">\n')
-
-        for i in range(self.num_folds):
-            if shape_type == "trapezoid":
-                points = self.create_trapezoid(i, x_center)
-            else:
-                points = self.create_rectangle(i, x_center)
-            svg.append(f'    <path d="{self.points_to_path(points)}"/>\n')
+        face_points, bbox = self._compute_all_points([(shape_type, x_center)])[0]
+        groups = [self._create_face_group("face", face_points, bbox)]
+        self._layouts[filename] = (0, 0, canvas_width, canvas_height, groups)
 
-        svg.append('  </g>\n')
+        svg.append(groups[0][1])
         svg.append('</svg>')
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.writelines(svg)
+        self._write_svg(filename, svg)
 
         return filename
 
@@ -303,14 +488,108 @@ class ConicBellowsGenerator:
      viewBox="0 0 {width} {height}">
 ''']
 
+    def _write_svg(self, filename, svg):
+        """Write SVG chunks to a file, encoded once and in a single write."""
+        with open(filename, 'wb', buffering=1024 * 1024) as f:
+            f.write("".join(svg).encode('utf-8'))
+
+    def _create_face_group(self, group_id, face_points, bbox):
+        """
+        Create the SVG group holding all the folds of one face.
+
+        The group carries its bounding box in a data-bbox attribute
+        ("x0 y0 x1 y1", in mm) so split_to_pages can leave it out of
+        pages it does not reach. An empty face (bbox None) has no data-bbox.
+
+        Returns:
+            Tuple (bbox, group_svg, face_points)
+        """
+        bbox_attr = f' data-bbox="{" ".join(map(_format_coordinate, bbox))}"' if bbox else ""
+        fmt = _format_coordinate
+        polygons = "".join([
+            _POLYGON_TEMPLATE % (fmt(x0), fmt(y0), fmt(x1), fmt(y1), fmt(x2), fmt(y2), fmt(x3), fmt(y3))
+            for (x0, y0), (x1, y1), (x2, y2), (x3, y3) in face_points])
+        group_svg = (f'  <g id="{group_id}"{bbox_attr} '
+                     f'stroke="{self.stroke_color}" stroke-width="{self.stroke_width}" fill="none">\n'
+                     f'{polygons}  </g>\n')
+        return bbox, group_svg, face_points
+
     def split_to_pages(self, svg_file, page_format="A4"):
         """
         Split SVG into multiple pages if it exceeds the page size.
 
+        Files written by this generator are split from their in-memory
+        layout; other files are read back from disk.
+
         Args:
             svg_file: Input SVG file to split
             page_format: "A4" (210x297mm) or "A3" (297x420mm)
 
+        Returns:
+            List of generated page filenames
+        """
+        layout = self._layouts.get(svg_file)
+        if layout is None:
+            layout = self._read_layout(svg_file)
+
+        _, _, svg_width, svg_height, groups = layout
+        return self._write_pages(svg_file, svg_width, svg_height, groups, page_format)
+
+    def _read_layout(self, svg_file):
+        """
+        Read canvas size and top-level groups back from an SVG file.
+
+        Files written by this generator (its own header, then only
+        non-nested <g> elements carrying a data-bbox) are sliced into their
+        groups straight from the source text. Any other file goes through
+        ElementTree, which keeps namespace declarations, comments and
+        quoting right. The geometry is not recovered (face_points is None).
+        """
+        with open(svg_file, encoding='utf-8') as f:
+            text = f.read()
+
+        header = _GENERATED_HEADER.match(text)
+        if header is not None:
+            body = text[header.end():text.rindex('</svg>')]
+            groups = []
+            position = 0
+            for match in re.finditer(r'[ \t]*<g\b([^>]*)>(.*?)</g>\n?', body, re.DOTALL):
+                bbox = re.search(r'data-bbox="([^"]*)"', match.group(1))
+                if (body[position:match.start()].strip() or bbox is None or
+                        re.search(r'<g\b', match.group(2))):
+                    # Edited after generation (other elements, nested
+                    # groups or no bounding box)
+                    break
+                groups.append(([float(v) for v in bbox.group(1).split()], match.group(0), None))
+                position = match.end()
+            else:
+                if groups and not body[position:].strip():
+                    return 0, 0, float(header.group(1)), float(header.group(2)), groups
+
+        root = ET.parse(svg_file).getroot()
+        svg_width = _parse_svg_length(root.get('width'), 'width', svg_file)
+        svg_height = _parse_svg_length(root.get('height'), 'height', svg_file)
+
+        groups = []
+        for child in root:
+            bbox = child.get('data-bbox')
+            bbox = [float(v) for v in bbox.split()] if bbox else None
+            groups.append((bbox, ET.tostring(child, encoding='unicode'), None))
+
+        return 0, 0, svg_width, svg_height, groups
+
+    def _write_pages(self, svg_file, svg_width, svg_height, groups, page_format):
+        """
+        Write the page files for a pattern.
+
+        Args:
+            svg_file: Pattern filename, used to name the pages
+            svg_width: Pattern width in mm
+            svg_height: Pattern height in mm
+            groups: List of (bbox, group_svg, face_points), bbox being None
+                    to keep the group on every page
+            page_format: "A4" or "A3"
+
         Returns:
             List of generated page filenames
         """
@@ -326,13 +605,6 @@ class ConicBellowsGenerator:
 
         page_w, page_h = page_sizes[page_format]
 
-        # Read SVG dimensions
-        tree = ET.parse(svg_file)
-        root = tree.getroot()
-
-        svg_width = float(root.get('width').replace('mm', ''))
-        svg_height = float(root.get('height').replace('mm', ''))
-
         # Calculate required pages
         cols = math.ceil(svg_width / page_w)
         rows = math.ceil(svg_height / page_h)
@@ -346,6 +618,11 @@ class ConicBellowsGenerator:
         base = os.path.splitext(svg_file)[0]
         pages = []
 
+        # Each page only keeps the groups it overlaps (clipping is done by
+        # the viewBox). The stroke overflows the bbox: miter joins on the
+        # 45° trapezoid corners reach ~1.21 stroke widths past the vertex
+        pad = 2.0 * self.stroke_width
+
         for row in range(rows):
             for col in range(cols):
                 page_file = f"{base}_page_{row+1}_{col+1}.svg"
@@ -362,19 +639,98 @@ class ConicBellowsGenerator:
      viewBox="{x_offset} {y_offset} {page_w} {page_h}">
 ''')
 
-                # Copy content
-                for child in root:
-                    svg.append(ET.tostring(child, encoding='unicode'))
+                page_groups = [group for group in groups if group[0] is None or (
+                    group[0][0] - pad < x_offset + page_w and group[0][2] + pad > x_offset and
+                    group[0][1] - pad < y_offset + page_h and group[0][3] + pad > y_offset)]
+                self._layouts[page_file] = (x_offset, y_offset, page_w, page_h, page_groups)
 
+                svg.extend(group[1] for group in page_groups)
                 svg.append('</svg>')
 
-                with open(page_file, 'w', encoding='utf-8') as f:
-                    f.writelines(svg)
+                self._write_svg(page_file, svg)
 
                 pages.append(page_file)
 
         return pages
 
+    def render_pdf(self, svg_file):
+        """
+        Render a generated SVG file (pattern, face or page) straight to PDF.
+        Requires: pip install pycairo
+
+        The polygons are drawn from the in-memory geometry, skipping the
+        SVG parsing done by cairosvg.
+
+        Args:
+            svg_file: SVG file written by this generator
+
+        Returns:
+            Output filename, or None if the file cannot be rendered directly
+            (pycairo missing, unknown file or unsupported stroke color)
+        """
+        layout = self._layouts.get(svg_file)
+        color = _parse_color(self.stroke_color)
+        if not _HAS_PYCAIRO or layout is None or color is None:
+            return None
+
+        view_x, view_y, width, height, groups = layout
+        if any(group[2] is None for group in groups):
+            return None
+
+        output_file = f"{os.path.splitext(svg_file)[0]}.pdf"
+
+        # Work in mm, like the SVG viewBox
+        pt_per_mm = 72.0 / 25.4
+        surface = cairo.PDFSurface(output_file, width * pt_per_mm, height * pt_per_mm)
+        ctx = cairo.Context(surface)
+        ctx.scale(pt_per_mm, pt_per_mm)
+        ctx.translate(-view_x, -view_y)
+        ctx.set_source_rgb(*color)
+        ctx.set_line_width(self.stroke_width)
+
+        for _, _, face_points in groups:
+            for points in face_points:
+                ctx.move_to(*points[0])
+                for point in points[1:]:
+                    ctx.line_to(*point)
+                ctx.close_path()
+        ctx.stroke()
+        surface.finish()
+
+        print(f"  → Rendered PDF: {output_file}")
+        return output_file
+
+def _parse_svg_length(value, name, svg_file):
+    """
+    Parse the width or height attribute of an <svg> element, in mm.
+
+    Unitless values are taken as mm, as the pattern's viewBox uses mm.
+    Raises ValueError for missing values or other units.
+    """
+    match = re.fullmatch(r'\s*([\d.]+)\s*([a-z%]*)\s*', value or "")
+    if match is None:
+        raise ValueError(f"{svg_file}: missing or invalid {name} on <svg>")
+    if match.group(2) not in ("", "mm"):
+        raise ValueError(f"{svg_file}: unsupported {name} unit '{match.group(2)}' (expected mm)")
+    return float(match.group(1))
+
+def _parse_color(color):
+    """
+    Convert a stroke color to an (r, g, b) tuple in the 0-1 range.
+
+    Supports "#rgb", "#rrggbb" and the basic CSS color names.
+    Returns None for anything else.
+    """
+    color = color.strip().lower()
+    if color in _NAMED_COLORS:
+        color = _NAMED_COLORS[color]
+
+    if re.fullmatch(r'#[0-9a-f]{3}', color):
+        return tuple(int(c * 2, 16) / 255.0 for c in color[1:])
+    if re.fullmatch(r'#[0-9a-f]{6}', color):
+        return tuple(int(color[i:i + 2], 16) / 255.0 for i in (1, 3, 5))
+    return None
+
 def convert_svg_to_format(svg_file, output_format):
     """
     Convert SVG to PNG, JPEG, or PDF.
@@ -391,52 +747,48 @@ def convert_svg_to_format(svg_file, output_format):
 
     if output_format == "png":
         output_file = f"{base}.png"
-        try:
-            import cairosvg
-            cairosvg.svg2png(url=svg_file, write_to=output_file, dpi=300)
-            print(f"  → Converted to PNG: {output_file}")
-            return output_file
-        except ImportError:
+        if not _HAS_CAIROSVG:
             print("  ⚠ cairosvg module required: pip install cairosvg")
             return None
 
+        cairosvg.svg2png(url=svg_file, write_to=output_file, dpi=300)
+        print(f"  → Converted to PNG: {output_file}")
+        return output_file
+
     elif output_format in ["jpeg", "jpg"]:
         output_file = f"{base}.jpg"
-        try:
-            import cairosvg
-            from PIL import Image
-            import io
-
-            # Convert SVG → PNG in memory
-            png_data = cairosvg.svg2png(url=svg_file, dpi=300)
-
-            # Convert PNG → JPEG
-            img = Image.open(io.BytesIO(png_data))
-
-            # Convert RGBA to RGB if needed
-            if img.mode == 'RGBA':
-                rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                rgb_img.paste(img, mask=img.split()[3])
-                img = rgb_img
-
-            img.save(output_file, 'JPEG', quality=95)
-            print(f"  → Converted to JPEG: {output_file}")
-            return output_file
-        except ImportError:
+        if not (_HAS_CAIROSVG and _HAS_PIL):
             print("  ⚠ Required modules: pip install cairosvg pillow")
             return None
 
+        # Convert SVG → PNG in memory
+        png_buffer = io.BytesIO()
+        cairosvg.svg2png(url=svg_file, write_to=png_buffer, dpi=300)
+        png_buffer.seek(0)
+
+        # Convert PNG → JPEG
+        img = Image.open(png_buffer)
+
+        # Convert RGBA to RGB if needed
+        if img.mode == 'RGBA':
+            rgb_img = Image.new('RGB', img.size, (255, 255, 255))
+            rgb_img.paste(img, mask=img.split()[3])
+            img = rgb_img
+
+        img.save(output_file, 'JPEG', quality=95)
+        print(f"  → Converted to JPEG: {output_file}")
+        return output_file
+
     elif output_format == "pdf":
         output_file = f"{base}.pdf"
-        try:
-            import cairosvg
-            cairosvg.svg2pdf(url=svg_file, write_to=output_file)
-            print(f"  → Converted to PDF: {output_file}")
-            return output_file
-        except ImportError:
+        if not _HAS_CAIROSVG:
             print("  ⚠ cairosvg module required: pip install cairosvg")
             return None
 
+        cairosvg.svg2pdf(url=svg_file, write_to=output_file)
+        print(f"  → Converted to PDF: {output_file}")
+        return output_file
+
     return None
 
 def main():
@@ -545,8 +897,25 @@ def main():
     # Convert format if requested
     if args.format != 'svg':
         print(f"\nConverting to {args.format.upper()}:")
-        for svg_file in svg_files:
-            convert_svg_to_format(svg_file, args.format)
+        if args.format == 'pdf':
+            # Draw PDFs from the geometry when pycairo is available,
+            # cairosvg converts whatever could not be rendered directly
+            svg_files = [f for f in svg_files if generator.render_pdf(f) is None]
+        needs_pil = args.format in ["jpeg", "jpg"]
+        if svg_files and not (_HAS_CAIROSVG and (_HAS_PIL or not needs_pil)):
+            # Report missing modules once, not once per file
+            if needs_pil:
+                print("  ⚠ Required modules: pip install cairosvg pillow")
+            else:
+                print("  ⚠ cairosvg module required: pip install cairosvg")
+        elif len(svg_files) > 1:
+            # Pages are independent: rasterize them on all cores
+            with ProcessPoolExecutor() as executor:
+                list(executor.map(convert_svg_to_format, svg_files,
+                                  [args.format] * len(svg_files)))
+        else:
+            for svg_file in svg_files:
+                convert_svg_to_format(svg_file, args.format)
 
 if __name__ == "__main__":
     main()